@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from charset_normalizer import from_bytes
+
+ENCODING_SAMPLE_SIZE = 64 * 1024
+KOREAN_ENCODINGS = {"cp949", "euc_kr", "euc-kr", "johab"}
+CSV_BLOCK_SIZE = 4 << 20
+
+
+def detect_encoding(path: str | Path) -> str:
+    with open(path, "rb") as handle:
+        sample = handle.read(ENCODING_SAMPLE_SIZE)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # Incremental decode so a multibyte char cut at the sample edge is not an error.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    # Files are rewritten in place, so only pick between the two legacy encodings
+    # this data actually uses; latin1 never fails and keeps bytes intact.
+    best = from_bytes(sample).best()
+    if best is not None and best.encoding in KOREAN_ENCODINGS:
+        return "cp949"
+    # Inconclusive, or a misguess such as big5 on a short cp949 file: keep cp949
+    # whenever the sample decodes cleanly with it.
+    try:
+        codecs.getincrementaldecoder("cp949")().decode(sample, final=False)
+        return "cp949"
+    except UnicodeDecodeError:
+        return "latin1"
+
+
+def keeps_text(column: pa.ChunkedArray) -> bool:
+    # Arrow parses ISO dates/times and widens integers past int64 to double; both
+    # would change the cell text, so such columns are re-read as plain strings.
+    if pa.types.is_temporal(column.type):
+        return True
+    if pa.types.is_floating(column.type):
+        largest = pc.max(pc.abs(column)).as_py()
+        return largest is not None and largest >= 2**63
+    return False
+
+
+def read_csv(
+    path: str | Path,
+    encoding: str,
+    columns: Optional[list[str]] = None,
+    dict_encode: bool = False,
+) -> pd.DataFrame:
+    read_options = pacsv.ReadOptions(encoding=encoding, block_size=CSV_BLOCK_SIZE)
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        auto_dict_encode=dict_encode,
+        strings_can_be_null=True,
+    )
+    try:
+        table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+        text_columns = [
+            name for name, column in zip(table.column_names, table.columns) if keeps_text(column)
+        ]
+        if text_columns:
+            convert_options.column_types = dict.fromkeys(text_columns, pa.string())
+            table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        table = None
+    if table is None or len(set(table.column_names)) < table.num_columns:
+        # Arrow rejects short rows and keeps duplicate headers; pandas pads the rows
+        # and renames duplicates (지역 -> 지역.1), so let it handle those files.
+        return pd.read_csv(path, encoding=encoding, usecols=columns, dtype_backend="pyarrow")
+    return table.to_pandas(types_mapper=arrow_dtype)
+
+
+def arrow_dtype(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    # Low-cardinality string columns arrive dictionary-encoded; returning None lets
+    # pandas keep them as categoricals instead of materializing every repeated value.
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def csv_table(df: pd.DataFrame) -> pa.Table:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Arrow prints 1.0 as "1" and booleans as true/false; keep the pandas.to_csv spelling.
+    for index, (name, series) in enumerate(df.items()):
+        if pd.api.types.is_bool_dtype(series.dtype):
+            column = pc.if_else(table.column(index), "True", "False")
+        elif pd.api.types.is_float_dtype(series.dtype):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            column = pa.array(values.astype(str), mask=np.isnan(values))
+        else:
+            continue
+        table = table.set_column(index, str(name), column)
+    return table
+
+
+def write_csv(df: pd.DataFrame, path: str | Path) -> None:
+    table = csv_table(df)
+    sink = pa.BufferOutputStream()
+    try:
+        options = pacsv.WriteOptions(include_header=False, quoting_style="none")
+        pacsv.write_csv(table, sink, options)
+    except pa.ArrowInvalid:
+        # Arrow can only quote every string field; pandas quotes just the cells that need it.
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+        return
+    # Arrow always quotes the header, so write it with the csv module like pandas does.
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(table.column_names)
+    # Arrow writes bare UTF-8; keep the BOM so the files still open cleanly in Excel.
+    with open(path, "wb") as handle:
+        handle.write(codecs.BOM_UTF8)
+        handle.write(header.getvalue().encode("utf-8"))
+        handle.write(sink.getvalue())
@@ -1,20 +1,29 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
-ENCODINGS: tuple[str, ...] = ("utf-8-sig", "utf-8", "cp949", "euc-kr", "latin1")
+from csv_io import detect_encoding, read_csv, write_csv
+
+ARROW_STRING = pd.ArrowDtype(pa.string())
 PERIOD_PATTERN = re.compile(r"^(?P<start>\d{6})-(?P<end>\d{6})_")
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 YEAR_KEYWORDS = {"year", "년도", "연도"}
 MONTH_KEYWORDS = {"month", "월"}
 DATE_COLUMN_HINTS = ("년", "월", "일", "date", "날짜", "기준", "period", "기간")
+DATE_HINT_PATTERN = re.compile("|".join(map(re.escape, DATE_COLUMN_HINTS)))
+KEEP_COLUMNS = {"year", "month"}
+DETECTION_SAMPLE_SIZE = 1000
 
 
 @dataclass(slots=True)
@@ -24,26 +33,6 @@ class DateColumns:
     combined_col: Optional[str] = None
 
 
-def detect_encoding(path: Path) -> str:
-    best_encoding: Optional[str] = None
-    best_score = -1
-    for encoding in ENCODINGS:
-        try:
-            df = pd.read_csv(path, encoding=encoding, nrows=0)
-        except Exception:  # noqa: BLE001
-            continue
-        header = "".join(df.columns.astype(str))
-        hangul_score = sum("가" <= ch <= "힣" for ch in header)
-        ascii_score = sum(ch.isascii() for ch in header)
-        score = hangul_score * 2 + ascii_score
-        if score > best_score:
-            best_score = score
-            best_encoding = encoding
-    if best_encoding is None:
-        raise ValueError(f"Failed to detect encoding for {path}")
-    return best_encoding
-
-
 def parse_period_from_name(name: str) -> tuple[Optional[int], Optional[int]]:
     match = PERIOD_PATTERN.match(name)
     if not match:
@@ -55,64 +44,72 @@ def parse_period_from_name(name: str) -> tuple[Optional[int], Optional[int]]:
 
 
 def normalize_column_name(name: str) -> str:
-    return re.sub(r"\s+", "", name).lower()
+    return WHITESPACE_PATTERN.sub("", name).lower()
+
+
+def should_drop(column: str) -> bool:
+    # Same rule as cleanup_all_data_dates.should_drop; its extra "일자" keyword
+    # is already covered by the "일" hint.
+    normalized = normalize_column_name(column)
+    if normalized in KEEP_COLUMNS:
+        return False
+    return DATE_HINT_PATTERN.search(normalized) is not None
+
+
+def extract_digits(series: pd.Series) -> pd.Series:
+    return series.dropna().astype(ARROW_STRING).str.replace(r"\D+", "", regex=True)
+
+
+def valid_ratio(mask: pd.Series) -> float:
+    # Arrow comparisons propagate nulls, which mean() would otherwise skip.
+    return mask.fillna(False).mean()
+
+
+def sample_series(series: pd.Series) -> pd.Series:
+    # Column detection only needs a representative slice; year/month values
+    # are still built from every row in determine_year_month.
+    return series.dropna().head(DETECTION_SAMPLE_SIZE)
 
 
 def is_year_series(series: pd.Series) -> bool:
-    digits = (
-        series.dropna()
-        .astype(str)
-        .str.replace(r"[^0-9]", "", regex=True)
-    )
+    digits = extract_digits(series)
     if digits.empty:
         return False
     numeric = pd.to_numeric(digits, errors="coerce")
-    valid = numeric.between(1900, 2100)
-    return valid.mean() >= 0.8
+    return valid_ratio(numeric.between(1900, 2100)) >= 0.8
 
 
 def is_month_series(series: pd.Series) -> bool:
-    digits = (
-        series.dropna()
-        .astype(str)
-        .str.replace(r"[^0-9]", "", regex=True)
-    )
+    digits = extract_digits(series)
     if digits.empty:
         return False
     numeric = pd.to_numeric(digits, errors="coerce")
-    valid = numeric.between(1, 12)
-    return valid.mean() >= 0.8
+    return valid_ratio(numeric.between(1, 12)) >= 0.8
 
 
 def detect_date_columns(df: pd.DataFrame) -> DateColumns:
     info = DateColumns()
-    for column in df.columns:
-        normalized = normalize_column_name(column)
-        series = df[column]
+    columns = list(zip(df.columns, map(normalize_column_name, df.columns)))
+    for column, normalized in columns:
         if info.year_col is None and (
             normalized in YEAR_KEYWORDS or normalized.endswith("년도")
         ):
-            if is_year_series(series):
+            if is_year_series(sample_series(df[column])):
                 info.year_col = column
                 continue
         if info.month_col is None and (
             normalized in MONTH_KEYWORDS or normalized == "기준월"
         ):
-            if is_month_series(series):
+            if is_month_series(sample_series(df[column])):
                 info.month_col = column
                 continue
 
     if info.year_col is None or info.month_col is None:
-        for column in df.columns:
-            normalized = normalize_column_name(column)
-            if not any(hint in normalized for hint in DATE_COLUMN_HINTS):
+        for column, normalized in columns:
+            if DATE_HINT_PATTERN.search(normalized) is None:
                 continue
-            series = df[column]
-            digits = (
-                series.dropna()
-                .astype(str)
-                .str.replace(r"[^0-9]", "", regex=True)
-            )
+            series = sample_series(df[column])
+            digits = extract_digits(series)
             if digits.empty:
                 continue
             lengths = digits.str.len()
@@ -121,7 +118,7 @@ def detect_date_columns(df: pd.DataFrame) -> DateColumns:
             numeric = pd.to_numeric(digits.str[:6], errors="coerce")
             months = pd.to_numeric(digits.str[4:6], errors="coerce")
             mask = numeric.notna() & months.between(1, 12)
-            if mask.mean() >= 0.6:
+            if valid_ratio(mask) >= 0.6:
                 info.combined_col = column
                 break
 
@@ -129,13 +126,28 @@ def detect_date_columns(df: pd.DataFrame) -> DateColumns:
 
 
 def extract_year_month_from_series(series: pd.Series) -> tuple[pd.Series, pd.Series]:
-    values = series.astype(str).str.replace(r"[^0-9]", "", regex=True)
-    year = pd.to_numeric(values.str[:4], errors="coerce")
-    month = pd.to_numeric(values.str[4:6], errors="coerce")
-    valid = year.between(1900, 2100) & month.between(1, 12)
-    year = year.where(valid)
-    month = month.where(valid)
-    return year.astype("Int64"), month.astype("Int64")
+    # Only the first six digits matter (YYYYMM, or YYYYM when the month is one digit).
+    digits = (
+        series.astype(ARROW_STRING)
+        .str.replace(r"[^0-9]", "", regex=True)
+        .to_numpy(dtype="U6", na_value="")
+    )
+    lengths = np.char.str_len(digits)
+    numbers = np.where(lengths >= 5, digits, "0").astype(np.int64)
+    single_digit_month = lengths == 5
+    year = np.where(single_digit_month, numbers // 10, numbers // 100)
+    month = np.where(single_digit_month, numbers % 10, numbers % 100)
+    invalid = ~(
+        (lengths >= 5)
+        & (year >= 1900)
+        & (year <= 2100)
+        & (month >= 1)
+        & (month <= 12)
+    )
+    return (
+        pd.Series(pd.arrays.IntegerArray(year, invalid), index=series.index),
+        pd.Series(pd.arrays.IntegerArray(month, invalid), index=series.index),
+    )
 
 
 def ensure_int_series(series: pd.Series) -> pd.Series:
@@ -184,11 +196,11 @@ def determine_year_month(
     return year_series, month_series, related_columns
 
 
-def process_file(path: Path) -> bool:
+def process_file(path: str | Path) -> bool:
     encoding = detect_encoding(path)
-    df = pd.read_csv(path, encoding=encoding)
+    df = read_csv(path, encoding, dict_encode=True)
 
-    fallback_year, fallback_month = parse_period_from_name(path.name)
+    fallback_year, fallback_month = parse_period_from_name(os.path.basename(path))
     info = detect_date_columns(df)
     year_series, month_series, related_columns = determine_year_month(
         df,
@@ -214,8 +226,9 @@ def process_file(path: Path) -> bool:
             order.append(column)
             seen.add(column)
 
-    df = df[order]
-    df.to_csv(path, index=False, encoding="utf-8-sig")
+    # Drop the source date columns here as well, so the file is only rewritten once.
+    df = df[[column for column in order if not should_drop(column)]]
+    write_csv(df, path)
     return True
 
 
@@ -226,12 +239,31 @@ def main() -> None:
         raise SystemExit(f"Target directory not found: {root}")
 
     folders = [root / str(i) for i in range(1, 8)]
-    processed = 0
+    paths: list[str] = []
     for folder in folders:
         if not folder.exists():
             continue
-        for path in sorted(folder.glob("*.csv")):
-            process_file(path)
+        with os.scandir(folder) as entries:
+            paths.extend(
+                sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".csv") and entry.is_file()
+                )
+            )
+
+    processed = 0
+    # Each worker already has a core; Arrow's own thread pool would oversubscribe them.
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), initializer=pa.set_cpu_count, initargs=(1,)
+    ) as executor:
+        futures = {executor.submit(process_file, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:  # noqa: BLE001
+                print(f"Failed to process {futures[future]}: {exc}")
+                continue
             processed += 1
 
     print(f"Processed {processed} files.")
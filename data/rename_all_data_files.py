@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -10,9 +11,12 @@ def main() -> None:
     if not target_dir.exists():
         raise SystemExit(f"Target directory not found: {target_dir}")
 
-    operations: list[tuple[Path, Path]] = []
+    operations: list[tuple[str, str]] = []
 
-    for folder in sorted(target_dir.iterdir()):
+    with os.scandir(target_dir) as entries:
+        folders = sorted(entries, key=lambda entry: entry.name)
+
+    for folder in folders:
         if not folder.is_dir():
             continue
         try:
@@ -23,21 +27,24 @@ def main() -> None:
 
         prefix = f"{period}_"
 
-        for file_path in sorted(folder.iterdir()):
-            if not file_path.is_file():
+        with os.scandir(folder.path) as entries:
+            files = sorted(entries, key=lambda entry: entry.name)
+
+        for file_entry in files:
+            if not file_entry.is_file():
                 continue
-            name = file_path.name
+            name = file_entry.name
             if "_" not in name:
                 continue
             suffix = name.split("_", 1)[1]
             new_name = prefix + suffix
             if new_name == name:
                 continue
-            new_path = file_path.with_name(new_name)
-            if new_path.exists():
+            new_path = os.path.join(folder.path, new_name)
+            if os.path.exists(new_path):
                 raise SystemExit(f"Target file already exists: {new_path}")
-            file_path.rename(new_path)
-            operations.append((file_path, new_path))
+            os.rename(file_entry.path, new_path)
+            operations.append((file_entry.path, new_path))
 
     if operations:
         print(f"Renamed {len(operations)} files.")
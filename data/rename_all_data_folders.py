@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 import re
 from collections import defaultdict
 from pathlib import Path
@@ -14,12 +15,16 @@ def main() -> None:
     if not target_dir.exists():
         raise SystemExit(f"Target directory not found: {target_dir}")
 
-    folders = [path for path in sorted(target_dir.iterdir()) if path.is_dir()]
+    with os.scandir(target_dir) as entries:
+        folders = sorted(
+            (entry for entry in entries if entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
     if not folders:
         print("No folders to rename.")
         return
 
-    period_groups: dict[str, list[Path]] = defaultdict(list)
+    period_groups: dict[str, list[os.DirEntry[str]]] = defaultdict(list)
     for folder in folders:
         match = PERIOD_PATTERN.search(folder.name)
         if not match:
@@ -27,23 +32,23 @@ def main() -> None:
         period_groups[match.group(1)].append(folder)
 
     # Keep summary for reporting
-    operations: list[tuple[Path, Path]] = []
+    operations: list[tuple[str, str]] = []
 
-    for period, paths in period_groups.items():
-        for index, path in enumerate(sorted(paths, key=lambda p: p.name), start=1):
+    for period, entries in period_groups.items():
+        for index, entry in enumerate(sorted(entries, key=lambda e: e.name), start=1):
             new_name = f"{period}_{index}"
-            new_path = target_dir / new_name
-            if path.name == new_name:
+            new_path = os.path.join(target_dir, new_name)
+            if entry.name == new_name:
                 continue
-            if new_path.exists():
+            if os.path.exists(new_path):
                 raise SystemExit(f"Target folder already exists: {new_path}")
-            path.rename(new_path)
-            operations.append((path, new_path))
+            os.rename(entry.path, new_path)
+            operations.append((entry.name, new_name))
 
     if operations:
         print("Renamed folders:")
-        for old_path, new_path in operations:
-            print(f"- {old_path.name} -> {new_path.name}")
+        for old_name, new_name in operations:
+            print(f"- {old_name} -> {new_name}")
     else:
         print("All folders already conform to the naming scheme.")
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -25,10 +26,13 @@ def main() -> None:
 
     destinations = ensure_destination_dirs(all_data_dir)
 
-    to_remove: list[Path] = []
+    to_remove: list[str] = []
     moved_count = 0
 
-    for entry in sorted(all_data_dir.iterdir()):
+    with os.scandir(all_data_dir) as entries:
+        folders = sorted(entries, key=lambda entry: entry.name)
+
+    for entry in folders:
         if not entry.is_dir():
             continue
         match = FOLDER_PATTERN.match(entry.name)
@@ -44,19 +48,22 @@ def main() -> None:
 
         dest_dir = destinations[index]
 
-        for item in sorted(entry.iterdir()):
+        with os.scandir(entry.path) as items:
+            files = sorted(items, key=lambda item: item.name)
+
+        for item in files:
             if item.is_dir():
-                raise SystemExit(f"Nested directory found inside {entry}: {item.name}")
-            target_path = dest_dir / item.name
-            if target_path.exists():
-                raise SystemExit(f"Cannot move {item} -> {target_path}: target exists")
-            item.rename(target_path)
+                raise SystemExit(f"Nested directory found inside {entry.path}: {item.name}")
+            target_path = os.path.join(dest_dir, item.name)
+            if os.path.exists(target_path):
+                raise SystemExit(f"Cannot move {item.path} -> {target_path}: target exists")
+            os.rename(item.path, target_path)
             moved_count += 1
 
-        to_remove.append(entry)
+        to_remove.append(entry.path)
 
     for folder in to_remove:
-        folder.rmdir()
+        os.rmdir(folder)
 
     print(f"Moved {moved_count} files into index-based folders.")
     if to_remove:
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 import re
 from pathlib import Path
 from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from csv_io import read_csv
 
 BASE_START = 202001
 BASE_END = 202509
@@ -16,24 +20,22 @@ DATE_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"(20\d{2})[-./]?(0[1-9]|1[0-2])"),
     re.compile(r"(20\d{2})\D(1[0-2]|0?[1-9])"),
 )
+# Non-capturing union of DATE_PATTERNS, evaluated by Arrow's RE2 engine in one pass.
+DATE_PREFILTER = r"20\d{2}(?:[-./]?(?:0[1-9]|1[0-2])|\D(?:1[0-2]|0?[1-9]))"
+ARROW_STRING = pd.ArrowDtype(pa.string())
+YEAR_MONTH_COLUMNS = ["년도", "월"]
 
 
 def iterate_months(start: int, end: int) -> list[int]:
-    months: list[int] = []
-    year = start // 100
-    month = start % 100
-    end_year = end // 100
-    end_month = end % 100
-    while (year < end_year) or (year == end_year and month <= end_month):
-        months.append(year * 100 + month)
-        month += 1
-        if month == 13:
-            month = 1
-            year += 1
-    return months
+    # Work in a running month index (year * 12 + month - 1) so the range is one arange.
+    start_index = (start // 100) * 12 + start % 100 - 1
+    end_index = (end // 100) * 12 + end % 100 - 1
+    years, months = np.divmod(np.arange(start_index, end_index + 1), 12)
+    return (years * 100 + months + 1).tolist()
 
 
-BASE_MONTHS = set(iterate_months(BASE_START, BASE_END))
+BASE_MONTHS = frozenset(iterate_months(BASE_START, BASE_END))
+BASE_MONTH_ARRAY = np.array(sorted(BASE_MONTHS), dtype=np.int32)
 
 
 def detect_encoding(path: Path) -> str:
@@ -53,23 +55,22 @@ def month_int_to_label(value: int) -> str:
     return f"{year:04d}-{month:02d}"
 
 
+def month_segments(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # values must be sorted and unique; returns the first/last YYYYMM of each consecutive run.
+    month_index = (values // 100) * 12 + values % 100
+    breaks = np.flatnonzero(np.diff(month_index) != 1)
+    starts = values[np.concatenate(([0], breaks + 1))]
+    ends = values[np.concatenate((breaks, [values.size - 1]))]
+    return starts, ends
+
+
 def months_to_ranges(months: Iterable[int], max_segments: int = 6) -> str:
-    values = sorted(set(months))
-    if not values:
+    values = np.unique(np.fromiter(months, dtype=np.int64))
+    if values.size == 0:
         return ""
 
-    segments: list[tuple[int, int]] = []
-    start = prev = values[0]
-    for current in values[1:]:
-        expected = (prev // 100) * 100 + ((prev % 100) + 1)
-        if prev % 100 == 12:
-            expected = (prev // 100 + 1) * 100 + 1
-        if current == expected:
-            prev = current
-            continue
-        segments.append((start, prev))
-        start = prev = current
-    segments.append((start, prev))
+    starts, ends = month_segments(values)
+    segments = list(zip(starts.tolist(), ends.tolist()))
 
     labels: list[str] = []
     for seg_start, seg_end in segments[:max_segments]:
@@ -84,36 +85,48 @@ def months_to_ranges(months: Iterable[int], max_segments: int = 6) -> str:
     return ", ".join(labels)
 
 
+def truncated_numbers(series: pd.Series) -> np.ndarray:
+    # Unparsable and empty cells both end up NaN in a float64 array; trunc keeps the
+    # old astype(int) behaviour for fractional values such as 2020.5.
+    numbers = pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return np.trunc(numbers)
+
+
+def extract_year_month_columns(df: pd.DataFrame) -> set[int]:
+    years = truncated_numbers(df["년도"])
+    months = truncated_numbers(df["월"])
+    # NaN fails every comparison, so invalid cells drop out here.
+    valid_mask = (years >= 2000) & (years <= 2030) & (months >= 1) & (months <= 12)
+    combos = years[valid_mask] * 100 + months[valid_mask]
+    return set(combos.astype(int).tolist())
+
+
 def extract_year_months(df: pd.DataFrame) -> set[int]:
     months: set[int] = set()
-    if {"년도", "월"}.issubset(df.columns):
-        year = pd.to_numeric(df["년도"], errors="coerce")
-        month = pd.to_numeric(df["월"], errors="coerce")
-        mask = year.notna() & month.notna()
-        if mask.any():
-            valid_years = year[mask].astype(int)
-            valid_months = month[mask].astype(int)
-            valid_mask = (
-                (valid_years >= 2000)
-                & (valid_years <= 2030)
-                & (valid_months >= 1)
-                & (valid_months <= 12)
-            )
-            combos = valid_years[valid_mask] * 100 + valid_months[valid_mask]
-            months.update(combos.tolist())
-
-    for column in df.columns:
-        series = df[column].dropna().astype(str)
-        for value in series:
-            for pattern in DATE_PATTERNS:
-                for match in pattern.finditer(value):
-                    year = int(match.group(1))
-                    month = int(match.group(2))
-                    if not (2000 <= year <= 2030):
-                        continue
-                    if month < 1 or month > 12:
-                        continue
-                    months.add(year * 100 + month)
+    if set(YEAR_MONTH_COLUMNS).issubset(df.columns):
+        months.update(extract_year_month_columns(df))
+
+    if df.columns.empty:
+        return months
+
+    # Stack every cell into one Arrow string column so each kernel runs once per file.
+    cells = pd.concat(
+        [series.dropna().astype(ARROW_STRING) for _, series in df.items()],
+        ignore_index=True,
+    )
+    cells = cells[cells.str.contains(DATE_PREFILTER)]
+    if cells.empty:
+        return months
+
+    for pattern in DATE_PATTERNS:
+        matches = cells.str.extractall(pattern)
+        if matches.empty:
+            continue
+        found_years = matches[0].astype(int)
+        found_months = matches[1].astype(int)
+        valid_mask = found_years.between(2000, 2030) & found_months.between(1, 12)
+        combos = found_years[valid_mask] * 100 + found_months[valid_mask]
+        months.update(combos.tolist())
 
     return months
 
@@ -141,7 +154,10 @@ class FileSummary:
 def summarize_file(path: Path) -> FileSummary:
     try:
         encoding = detect_encoding(path)
-        df = pd.read_csv(path, encoding=encoding)
+        header = pd.read_csv(path, encoding=encoding, nrows=0).columns
+        # Files with explicit 년도/월 columns only need those two for the summary.
+        has_year_month = set(YEAR_MONTH_COLUMNS).issubset(header)
+        df = read_csv(path, encoding, YEAR_MONTH_COLUMNS if has_year_month else None)
     except Exception as exc:  # noqa: BLE001
         return FileSummary(
             file_name=path.name,
@@ -153,16 +169,18 @@ def summarize_file(path: Path) -> FileSummary:
             notes=f"read_error:{exc}",
         )
 
-    year_months = extract_year_months(df)
-    present = sorted(value for value in year_months if BASE_START <= value <= BASE_END)
-
-    outside = sorted(
-        value for value in year_months if value < BASE_START or value > BASE_END
-    )
-    missing = sorted(BASE_MONTHS.difference(present))
-
-    start = month_int_to_label(min(year_months)) if year_months else ""
-    end = month_int_to_label(max(year_months)) if year_months else ""
+    if has_year_month:
+        found_months = extract_year_month_columns(df)
+    else:
+        found_months = extract_year_months(df)
+    year_months = np.sort(np.fromiter(found_months, dtype=np.int32))
+    in_base = (year_months >= BASE_START) & (year_months <= BASE_END)
+    present = year_months[in_base]
+    outside = year_months[~in_base]
+    missing = np.setdiff1d(BASE_MONTH_ARRAY, present, assume_unique=True)
+
+    start = month_int_to_label(int(year_months[0])) if year_months.size else ""
+    end = month_int_to_label(int(year_months[-1])) if year_months.size else ""
     data_range = f"{start}~{end}".strip("~")
     if not data_range:
         name_start, name_end = parse_period_from_name(path.name)
@@ -170,11 +188,11 @@ def summarize_file(path: Path) -> FileSummary:
             data_range = f"{month_int_to_label(name_start)}~{month_int_to_label(name_end)}"
 
     notes: list[str] = []
-    if not year_months:
+    if not year_months.size:
         notes.append("기간 정보 확인 불가")
-    if outside:
+    if outside.size:
         notes.append(
-            f"기준 외 {len(outside)}개월 (예: {month_int_to_label(outside[0])})"
+            f"기준 외 {outside.size}개월 (예: {month_int_to_label(int(outside[0]))})"
         )
 
     missing_ranges = months_to_ranges(missing)
@@ -182,8 +200,8 @@ def summarize_file(path: Path) -> FileSummary:
         file_name=path.name,
         folder=path.parent.name,
         data_range=data_range,
-        present_count=len(present),
-        missing_count=len(missing),
+        present_count=int(present.size),
+        missing_count=int(missing.size),
         missing_ranges=missing_ranges,
         notes=", ".join(notes),
     )
@@ -201,7 +219,10 @@ def main() -> None:
     result_dir = target_dir / "result"
     result_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.DataFrame([asdict(summary) for summary in summaries])
+    df = pd.DataFrame(
+        [asdict(summary) for summary in summaries],
+        columns=[field.name for field in fields(FileSummary)],
+    )
     csv_path = result_dir / "기간누락_요약.csv"
     df.to_csv(csv_path, index=False, encoding="utf-8-sig")
 
@@ -215,12 +236,14 @@ def main() -> None:
     md_lines.append("| 파일명 | 데이터 범위 | 확보 개월수 | 누락 개월수 | 주요 누락 구간 | 비고 |")
     md_lines.append("| --- | --- | ---: | ---: | --- | --- |")
 
-    for summary in sorted(summaries, key=lambda x: x.missing_count, reverse=True):
-        md_lines.append(
-            f"| {summary.file_name} | {summary.data_range or '-'} | "
-            f"{summary.present_count} | {summary.missing_count} | "
-            f"{summary.missing_ranges or '-'} | {summary.notes or '-'} |"
-        )
+    table = df.sort_values("missing_count", ascending=False, kind="stable").astype(str)
+    for column in ("data_range", "missing_ranges", "notes"):
+        table[column] = table[column].replace("", "-")
+    rows = "| " + table["file_name"].str.cat(
+        table[["data_range", "present_count", "missing_count", "missing_ranges", "notes"]],
+        sep=" | ",
+    ) + " |"
+    md_lines.extend(rows.tolist())
 
     md_path = result_dir / "기간누락_요약.md"
     md_path.write_text("\n".join(md_lines), encoding="utf-8-sig")